@@ -1,20 +1,79 @@
 #!/usr/bin/env python3
 """
-UWC2-PYTHON Code Rescue Tool
+Code Rescue Tool
 
 A tool to help students preserve their coursework by forking repositories
-from the UWC2-PYTHON GitHub Classroom organization to their personal accounts
-before losing access.
+from GitHub Classroom organizations (UWC2-PYTHON by default) to their
+personal accounts before losing access.
 
 Author: Eric Fisher & GitHub Copilot
 """
 
+import argparse
+import bisect
+import fnmatch
+import heapq
+import json
+import os
+import random
+import re
 import subprocess
-from github import Github, Auth
-from typing import List
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import requests
+import urllib3
+from github import (Github, Auth, GithubException, RateLimitExceededException,
+                    UnknownObjectException)
+from github.Repository import Repository
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# Source organizations searched when none are given on the command line
+DEFAULT_ORGS = ["UWC2-PYTHON"]
+
+# Discovery snapshots: repository records plus a high-water mark, so later
+# runs only list repositories updated since the previous run. A full
+# listing is done periodically to drop deleted or renamed repositories.
+SNAPSHOT_DIR = os.path.join(os.path.expanduser("~"), ".code_rescue")
+SNAPSHOT_RECONCILE_INTERVAL = timedelta(days=7)
+# Repository fields kept in a snapshot record
+SNAPSHOT_FIELDS = ["name", "full_name", "url", "html_url", "description",
+                   "private", "fork"]
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Fewer visible repositories than this means the API view is limited
+# (usually SSO not authorized), so the listing can't be trusted as complete
+MIN_FULL_VIEW_REPOS = 10
+
+# Fork retry policy: jittered exponential backoff for transient errors.
+# create_fork is idempotent, so repeating a request is always safe. The
+# fork client is built with PyGithub's own retry disabled so this policy
+# is the only retry layer and sees every 5xx and rate-limit response.
+FORK_MAX_ATTEMPTS = 4
+FORK_BACKOFF_BASE = 2.0
+FORK_BACKOFF_CAP = 60.0
+# Pause applied when GitHub signals abuse detection without a Retry-After
+ABUSE_PAUSE_SECONDS = 60.0
+
+
+# GraphQL lets us fetch every fork together with its parent in one
+# paginated query; the REST listing omits ``parent`` and would need one
+# extra request per fork.
+FORK_PARENTS_QUERY = """
+query($login: String!, $cursor: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: 100, after: $cursor, isFork: true,
+                 ownerAffiliations: [OWNER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes { nameWithOwner parent { nameWithOwner } }
+    }
+  }
+}
+"""
 
 
-def get_github_token() -> str:
+def get_github_token(orgs: List[str]) -> str:
     """Get GitHub token from CLI or manual input."""
     try:
         result = subprocess.run(['gh', 'auth', 'token'],
@@ -33,17 +92,18 @@ def get_github_token() -> str:
         choice = input("Choose option (1 or 2): ").strip()
 
         if choice == "1":
-            return setup_github_cli_with_sso()
+            return setup_github_cli_with_sso(orgs)
         else:
-            return get_manual_token()
+            return get_manual_token(orgs)
 
 
-def setup_github_cli_with_sso() -> str:
+def setup_github_cli_with_sso(orgs: List[str]) -> str:
     """Set up GitHub CLI with SSO support."""
     print("\n🔧 Setting up GitHub CLI with SSO support...")
     print("=" * 50)
     print("GitHub CLI can handle SSO authorization automatically.")
-    print("This should allow access to your UWC2-PYTHON repositories.")
+    print(f"This should allow access to your {', '.join(orgs)} "
+          "repositories.")
     print()
 
     # First, try to login with GitHub CLI
@@ -56,7 +116,7 @@ def setup_github_cli_with_sso() -> str:
     proceed = input("Ready to authenticate? (y/N): ").strip().lower()
     if proceed != 'y':
         print("❌ Authentication cancelled. Falling back to manual token.")
-        return get_manual_token()
+        return get_manual_token(orgs)
 
     try:
         # Run the auth login command
@@ -75,66 +135,74 @@ def setup_github_cli_with_sso() -> str:
         token = token_result.stdout.strip()
 
         print("\nStep 2: Testing SSO access...")
-        return test_sso_access(token)
+        return test_sso_access(token, orgs)
 
     except subprocess.CalledProcessError as e:
         print(f"❌ GitHub CLI authentication failed: {e}")
         print("Falling back to manual token entry.")
-        return get_manual_token()
-
-
-def test_sso_access(token: str) -> str:
-    """Test if the token has SSO access to UWC2-PYTHON."""
-    print("🔍 Testing access to UWC2-PYTHON repositories...")
-
-    try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
-
-        # Try to access a known student repository pattern
-        print("Attempting to search for your repositories in UWC2-PYTHON...")
-        user = g.get_user()
-        username = user.login
-
-        # Try to search for repositories with the user's name
-        search_query = f"org:UWC2-PYTHON {username} in:name"
-        repos = list(g.search_repositories(search_query))
-
-        if repos:
-            print(f"🎉 SUCCESS! Found {len(repos)} repositories:")
-            for repo in repos[:5]:  # Show first 5
-                print(f"   - {repo.name}")
-            if len(repos) > 5:
-                print(f"   ... and {len(repos) - 5} more")
-            print("\n✅ SSO access is working! Your repositories should be")
-            print("   accessible.")
-        else:
-            print("⚠️  No repositories found in search, but this might be")
-            print("   normal.")
-            print("   We'll proceed and see if direct access works.")
-
-        return token
+        return get_manual_token(orgs)
+
+
+def test_sso_access(token: str, orgs: List[str]) -> str:
+    """Test if the token has SSO access to each source organization."""
+    print(f"🔍 Testing access to {', '.join(orgs)} repositories...")
+
+    auth = Auth.Token(token)
+    g = Github(auth=auth)
+    sso_needed = []
+
+    for org_name in orgs:
+        try:
+            # Try to access a known student repository pattern
+            print("Attempting to search for your repositories in "
+                  f"{org_name}...")
+            user = g.get_user()
+            username = user.login
+
+            # Try to search for repositories with the user's name
+            search_query = f"org:{org_name} {username} in:name"
+            repos = list(g.search_repositories(search_query))
+
+            if repos:
+                print(f"🎉 SUCCESS! Found {len(repos)} repositories:")
+                for repo in repos[:5]:  # Show first 5
+                    print(f"   - {repo.name}")
+                if len(repos) > 5:
+                    print(f"   ... and {len(repos) - 5} more")
+                print(f"\n✅ SSO access to {org_name} is working! Your")
+                print("   repositories should be accessible.")
+            else:
+                print("⚠️  No repositories found in search, but this might "
+                      "be")
+                print("   normal.")
+                print("   We'll proceed and see if direct access works.")
+
+        except Exception as e:
+            if "SAML enforcement" in str(e) or "403" in str(e):
+                print(f"\n❌ SSO authorization still needed for {org_name}!")
+                sso_needed.append(org_name)
+            else:
+                print(f"⚠️  Unexpected error: {e}")
+                print("   Proceeding anyway - the tool will provide manual")
+                print("   instructions if needed.")
 
-    except Exception as e:
-        if "SAML enforcement" in str(e) or "403" in str(e):
-            print("\n❌ SSO authorization still needed!")
-            return handle_sso_authorization_needed(token)
-        else:
-            print(f"⚠️  Unexpected error: {e}")
-            print("   Proceeding anyway - the tool will provide manual")
-            print("   instructions if needed.")
-            return token
+    if sso_needed:
+        return handle_sso_authorization_needed(token, sso_needed)
+    return token
 
 
-def handle_sso_authorization_needed(token: str) -> str:
+def handle_sso_authorization_needed(token: str, orgs: List[str]) -> str:
     """Handle the case where SSO authorization is still needed."""
     print("🔐 SSO Authorization Required")
     print("=" * 40)
-    print("Your GitHub CLI token needs to be authorized for the")
-    print("UWC2-PYTHON organization.")
+    print("Your GitHub CLI token needs to be authorized for:")
+    for org_name in orgs:
+        print(f"   - {org_name}")
     print()
     print("Please follow these steps:")
-    print("1. Open: https://github.com/orgs/UWC2-PYTHON/sso")
+    print("1. Open the SSO page for each organization:")
+    for org_name in orgs:
+        print(f"   https://github.com/orgs/{org_name}/sso")
     print("2. Look for your GitHub CLI token in the list")
     print("3. Click 'Authorize' next to it")
     print("4. Complete any SSO authentication steps")
@@ -143,31 +211,34 @@ def handle_sso_authorization_needed(token: str) -> str:
     print("1. Go to: https://github.com/settings/tokens")
     print("2. Find your GitHub CLI token")
     print("3. Click 'Configure SSO' next to it")
-    print("4. Authorize it for UWC2-PYTHON")
+    print(f"4. Authorize it for {', '.join(orgs)}")
     print()
 
     input("Press Enter after completing SSO authorization...")
 
     # Test again
     print("\n🔍 Testing SSO access again...")
-    try:
-        auth = Auth.Token(token)
-        g = Github(auth=auth)
+    auth = Auth.Token(token)
+    g = Github(auth=auth)
+
+    for org_name in orgs:
+        try:
+            # Try a simple organization access
+            org = g.get_organization(org_name)
+            print(f"✅ SSO authorization successful! Can access {org.name}")
+
+        except Exception as e:
+            print(f"❌ SSO authorization for {org_name} still not working: "
+                  f"{e}")
+            print("\nThe tool will still work, but repositories will need "
+                  "to")
+            print("be rescued manually.")
+            print("Don't worry - manual rescue is just as effective!")
 
-        # Try a simple organization access
-        org = g.get_organization("UWC2-PYTHON")
-        print(f"✅ SSO authorization successful! Can access {org.name}")
-        return token
-
-    except Exception as e:
-        print(f"❌ SSO authorization still not working: {e}")
-        print("\nThe tool will still work, but repositories will need to")
-        print("be rescued manually.")
-        print("Don't worry - manual rescue is just as effective!")
-        return token
+    return token
 
 
-def get_manual_token() -> str:
+def get_manual_token(orgs: List[str]) -> str:
     """Get token through manual entry."""
     print("\n🔑 Manual Token Entry")
     print("Please enter your Personal Access Token.")
@@ -175,7 +246,8 @@ def get_manual_token() -> str:
     print("Required scopes: repo, read:org")
     print()
     print("⚠️  Note: Manual tokens may need separate SSO authorization")
-    print("   at https://github.com/orgs/UWC2-PYTHON/sso")
+    for org_name in orgs:
+        print(f"   at https://github.com/orgs/{org_name}/sso")
 
     token = input("\nPAT: ").strip()
     if not token:
@@ -184,24 +256,185 @@ def get_manual_token() -> str:
     return token
 
 
-def verify_token(g: Github) -> bool:
-    """Verify the token works and can access UWC2-PYTHON."""
+def verify_token(g: Github, orgs: List[str]) -> Dict[str, bool]:
+    """
+    Verify the token works and check access to each source organization.
+    Returns a map of organization name to whether it is accessible, or an
+    empty map if the token itself is invalid.
+    """
     try:
         user = g.get_user()
         print(f"✅ Token verified for user: {user.login}")
+    except Exception as e:
+        print(f"❌ Token verification failed: {e}")
+        return {}
+
+    org_access = {}
+    for org_name in orgs:
+        try:
+            org = g.get_organization(org_name)
+            print(f"✅ Can access organization: {org.name}")
+            org_access[org_name] = True
+        except Exception as e:
+            print(f"❌ Cannot access organization {org_name}: {e}")
+            print(f"   Authorize SSO at https://github.com/orgs/{org_name}"
+                  "/sso")
+            org_access[org_name] = False
+
+    return org_access
+
+
+def snapshot_path(username: str, org_name: str) -> str:
+    """Path of the discovery snapshot for one user's view of an org."""
+    return os.path.join(SNAPSHOT_DIR, f"{username}-{org_name}.json".lower())
+
+
+def parse_timestamp(value) -> Optional[datetime]:
+    """Parse a snapshot timestamp, or return None if it is malformed."""
+    try:
+        return datetime.strptime(value, TIMESTAMP_FORMAT).replace(
+            tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return None
+
+
+def load_snapshot(path: str) -> Optional[dict]:
+    """
+    Load a discovery snapshot, or None if missing or unreadable.
+    high_water_mark and last_full_sync are None until a listing with a
+    full API view has been made.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(snapshot, dict) or not isinstance(
+            snapshot.get("repos"), list):
+        return None
+    for key in ("high_water_mark", "last_full_sync"):
+        value = snapshot.setdefault(key, None)
+        if value is not None and parse_timestamp(value) is None:
+            return None
+    for record in snapshot["repos"]:
+        if not isinstance(record, dict) or not all(
+                isinstance(record.get(field), str)
+                for field in ("name", "full_name", "updated_at")):
+            return None
+    return snapshot
+
+
+def save_snapshot(path: str, snapshot: dict) -> None:
+    """Write a discovery snapshot, ignoring filesystem errors."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not save discovery snapshot: {e}")
+
+
+def repo_record(repo) -> dict:
+    """Convert a repository into a snapshot record."""
+    record = {field: getattr(repo, field) for field in SNAPSHOT_FIELDS}
+    record["updated_at"] = repo.updated_at.strftime(TIMESTAMP_FORMAT)
+    return record
 
-        # Test UWC2-PYTHON access
-        org = g.get_organization("UWC2-PYTHON")
-        print(f"✅ Can access organization: {org.name}")
-        return True
 
+def list_org_repositories(g: Github, org_name: str, username: str,
+                          full_refresh: bool = False) -> List:
+    """
+    List one organization's repositories, or [] if inaccessible.
+    Uses the discovery snapshot to list only repositories updated since
+    the last run, doing a full listing when the snapshot is missing, due
+    for reconciliation or full_refresh is set. When the live API view is
+    limited only the live listing is returned; it is merged into the
+    snapshot but does not count as a full sync or move the high-water
+    mark, so the next run with full access lists the organization again.
+    """
+    path = snapshot_path(username, org_name)
+    snapshot = load_snapshot(path)
+    now = datetime.now(timezone.utc)
+
+    last_full = parse_timestamp(snapshot and snapshot.get("last_full_sync"))
+    if (full_refresh or last_full is None
+            or snapshot["high_water_mark"] is None
+            or now - last_full >= SNAPSHOT_RECONCILE_INTERVAL):
+        full_refresh = True
+
+    try:
+        org = g.get_organization(org_name)
+        # A limited view (e.g. lapsed SSO) would make cached records look
+        # accessible, so check the live count before listing incrementally
+        if not full_refresh and \
+                org.get_repos().totalCount < MIN_FULL_VIEW_REPOS:
+            full_refresh = True
+
+        if full_refresh:
+            records = {}
+            for repo in org.get_repos():
+                records[repo.full_name.lower()] = repo_record(repo)
+            if len(records) < MIN_FULL_VIEW_REPOS:
+                live_records = list(records.values())
+                if snapshot:
+                    if snapshot["last_full_sync"] is None:
+                        print(f"   {org_name}: earlier run also had a "
+                              "limited view, merging its repositories")
+                    else:
+                        print(f"   {org_name}: API view limited, keeping "
+                              f"the {len(snapshot['repos'])} repositories "
+                              "from the last snapshot")
+                    for record in snapshot["repos"]:
+                        records.setdefault(record["full_name"].lower(),
+                                           record)
+                else:
+                    snapshot = {"high_water_mark": None,
+                                "last_full_sync": None}
+                # Not a full sync: keep the earlier mark and sync time
+                snapshot["repos"] = list(records.values())
+                save_snapshot(path, snapshot)
+                return [g.create_from_raw_data(Repository, record)
+                        for record in live_records]
+            snapshot = {"last_full_sync": now.strftime(TIMESTAMP_FORMAT)}
+        else:
+            records = {record["full_name"].lower(): record
+                       for record in snapshot["repos"]}
+            high_water_mark = snapshot["high_water_mark"]
+            new_count = 0
+            # Newest first, so stop at the first repo older than the mark
+            for repo in org.get_repos(sort="updated", direction="desc"):
+                record = repo_record(repo)
+                if record["updated_at"] < high_water_mark:
+                    break
+                records[repo.full_name.lower()] = record
+                new_count += 1
+            print(f"   {org_name}: {new_count} repositories updated since "
+                  f"{high_water_mark}")
     except Exception as e:
-        print(f"❌ Token verification failed: {e}")
-        return False
+        print(f"❌ Could not access {org_name} repositories via API: {e}")
+        return []
+
+    snapshot["repos"] = list(records.values())
+    snapshot["high_water_mark"] = max(
+        (record["updated_at"] for record in snapshot["repos"]),
+        default=now.strftime(TIMESTAMP_FORMAT))
+    save_snapshot(path, snapshot)
+
+    return [g.create_from_raw_data(Repository, record)
+            for record in snapshot["repos"]]
 
 
-def discover_repositories(g: Github) -> tuple[List, List, List]:
-    """Discover personal and organization repositories."""
+def discover_repositories(g: Github, orgs: List[str],
+                          full_refresh: bool = False
+                          ) -> tuple[List, Dict[str, List], List]:
+    """
+    Discover personal and organization repositories.
+    Organizations are listed in parallel; the second element maps each
+    organization name to its API accessible repositories.
+    """
     print("\n🔍 Discovering repositories...")
 
     # Personal repositories (only those owned by the user, not org repos)
@@ -213,23 +446,23 @@ def discover_repositories(g: Github) -> tuple[List, List, List]:
     print(f"✅ Found {len(personal_repos)} personal repositories")
     print(f"   (filtered from {len(all_user_repos)} total accessible repos)")
 
-    # UWC2-PYTHON repositories (API accessible)
-    api_accessible_repos = []
-    try:
-        org = g.get_organization("UWC2-PYTHON")
-        api_accessible_repos = list(org.get_repos())
-        print(f"✅ Found {len(api_accessible_repos)} UWC2-PYTHON repositories "
-              "via API")
-
-        if len(api_accessible_repos) > 10:  # Good SSO access
-            print("🎉 Great! Your SSO authorization is working properly!")
+    # Organization repositories (API accessible), one shard per org
+    with ThreadPoolExecutor(max_workers=len(orgs) or 1) as executor:
+        results = executor.map(
+            lambda name: list_org_repositories(g, name, user.login,
+                                               full_refresh),
+            orgs)
+        org_repos = dict(zip(orgs, results))
 
-    except Exception as e:
-        print(f"❌ Could not access UWC2-PYTHON repositories via API: {e}")
+    for org_name, repos in org_repos.items():
+        print(f"✅ Found {len(repos)} {org_name} repositories via API")
+        if len(repos) >= MIN_FULL_VIEW_REPOS:  # Good SSO access
+            print(f"🎉 Great! Your SSO authorization for {org_name} is "
+                  "working properly!")
 
     # Check for repositories that might already be rescued
     # (only in actual personal repos)
-    # Note: This excludes UWC2-PYTHON org repos where you're a collaborator
+    # Note: This excludes org repos where you're a collaborator
     rescued_repos = []
     # Common patterns for course repositories - focus on course numbers
     course_patterns = ['uwc2', 'UWC2', '310-', '320-', '330-',
@@ -245,97 +478,337 @@ def discover_repositories(g: Github) -> tuple[List, List, List]:
     print(f"🔍 Found {len(rescued_repos)} potentially rescued course "
           "repos in personal account")
 
-    return personal_repos, api_accessible_repos, rescued_repos
+    return personal_repos, org_repos, rescued_repos
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
 
 
-def prompt_for_manual_repositories() -> List[str]:
-    """Prompt user to manually enter repository names from web interface."""
-    print("\n📋 Manual Repository Entry")
+class RepoNameIndex:
+    """
+    Case-insensitive index of repository names for validating manual entry.
+    Supports exact lookup, closest-match suggestions via trigrams and
+    glob patterns narrowed by literal prefix or trigrams.
+    """
+
+    # Most candidates scored when suggesting
+    SUGGEST_CANDIDATES = 256
+    # Glob candidates small enough to check with fnmatch directly
+    MATCH_CANDIDATES = 64
+
+    def __init__(self, names: Iterable[str]):
+        by_key = {name.lower(): name for name in names}
+        self.keys = sorted(by_key)
+        self.names = [by_key[key] for key in self.keys]
+        self.positions = {key: i for i, key in enumerate(self.keys)}
+        self.postings: Dict[str, Set[int]] = {}
+        self.trigram_counts = []
+        for i, key in enumerate(self.keys):
+            # Pad so short names and name boundaries still get trigrams
+            grams = trigrams(f"^{key}$")
+            self.trigram_counts.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, set()).add(i)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Return the indexed spelling of name, or None if unknown."""
+        i = self.positions.get(name.lower())
+        return None if i is None else self.names[i]
+
+    def prefix_range(self, prefix: str) -> range:
+        """Index positions of every name starting with prefix."""
+        prefix = prefix.lower()
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\uffff")
+        return range(lo, hi)
+
+    def rarest_postings(self, grams: Iterable[str]) -> List[Set[int]]:
+        """Posting sets of the given trigrams, smallest first."""
+        return sorted((self.postings.get(gram, set()) for gram in grams),
+                      key=len)
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """Return up to limit indexed names closest to name."""
+        grams = trigrams(f"^{name.lower()}$")
+
+        postings = [posting for posting in self.rarest_postings(grams)
+                    if posting]
+        if not postings:
+            return []
+
+        # Rare trigrams are the most telling, so gather candidates from
+        # those instead of counting every name sharing a common trigram.
+        # If even the rarest is common, keep the names sharing the most
+        # rare trigrams by intersecting until few enough remain.
+        candidates = set()
+        for posting in postings:
+            if candidates and len(candidates) + len(posting) > \
+                    self.SUGGEST_CANDIDATES:
+                break
+            candidates |= posting
+        for posting in postings[1:]:
+            if len(candidates) <= self.SUGGEST_CANDIDATES:
+                break
+            candidates = candidates & posting or candidates
+        if len(candidates) > self.SUGGEST_CANDIDATES:
+            candidates = set(sorted(candidates)[:self.SUGGEST_CANDIDATES])
+
+        # Count shared trigrams with set intersections, not per-name sets
+        shared = Counter()
+        for posting in postings:
+            shared.update(candidates & posting)
+
+        def similarity(i):
+            common = shared[i]
+            return common / (len(grams) + self.trigram_counts[i] - common)
+
+        best = heapq.nlargest(limit, candidates, key=similarity)
+        return [self.names[i] for i in best if similarity(i) >= 0.3]
+
+    def match(self, pattern: str) -> List[str]:
+        """Return every indexed name matching a glob pattern."""
+        pattern = pattern.lower()
+        literals = [part for part in re.split(r"\*|\?|\[[^\]]*\]", pattern)
+                    if part]
+        prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+
+        candidates = self.prefix_range(prefix)
+        grams = set().union(*(trigrams(part) for part in literals))
+        postings = self.rarest_postings(grams)
+        if postings and len(postings[0]) < len(candidates):
+            # Intersect rarest first; fnmatch settles the last few names
+            narrowed = postings[0]
+            for posting in postings[1:]:
+                if len(narrowed) <= self.MATCH_CANDIDATES:
+                    break
+                narrowed = narrowed & posting
+            candidates = sorted(narrowed)
+
+        matches = re.compile(fnmatch.translate(pattern)).match
+        return [self.names[i] for i in candidates if matches(self.keys[i])]
+
+
+def known_repository_names(username: str, org_name: str,
+                           repos: List) -> List[str]:
+    """
+    Names of an organization's repositories known from discovery.
+    Includes the cached discovery snapshot, which may cover more than the
+    current API view.
+    """
+    names = [repo.name for repo in repos]
+    snapshot = load_snapshot(snapshot_path(username, org_name))
+    if snapshot:
+        names.extend(record["name"] for record in snapshot["repos"])
+    return names
+
+
+def prompt_for_manual_repositories(org_name: str,
+                                   index: RepoNameIndex = None) -> List[str]:
+    """
+    Prompt user to manually enter repository names from web interface.
+    Names are checked against index when given; glob patterns such as
+    320-sp25-*-myname expand to every matching indexed name.
+    Returns full ``org/name`` repository names.
+    """
+    if index is None:
+        index = RepoNameIndex([])
+
+    print(f"\n📋 Manual Repository Entry ({org_name})")
     print("=" * 50)
     print("Since GitHub's API limits access to private organization")
-    print("repositories, please manually enter the names of UWC2-PYTHON")
+    print(f"repositories, please manually enter the names of {org_name}")
     print("repositories you want to rescue.")
     print("You can find these at:")
-    print("https://github.com/orgs/UWC2-PYTHON/repositories")
+    print(f"https://github.com/orgs/{org_name}/repositories")
     print()
     print("Instructions:")
-    print("1. Visit the UWC2-PYTHON organization page")
+    print(f"1. Visit the {org_name} organization page")
     print("2. Look for repositories that contain YOUR work")
     print("   (usually have your GitHub username)")
-    print("3. Enter repository names one per line")
+    print("3. Enter repository names one per line, or paste several")
+    print("   separated by spaces or commas")
+    if index:
+        print(f"   Names are checked against {len(index)} known repositories")
+        print("   and patterns like 320-sp25-*-yourusername are expanded")
     print("4. Press Enter on an empty line when done")
     print()
 
     repo_names = []
+    # Unknown names are added provisionally and reviewed once input is
+    # finished, so pasted lines are never read as a confirmation answer
+    unknown_names = []
+
+    def add(name):
+        full_name = f"{org_name}/{name}"
+        if full_name not in repo_names:
+            repo_names.append(full_name)
+            print(f"   ✅ Added: {full_name}")
+        else:
+            print(f"   ⚠️  Already added: {full_name}")
+
     while True:
         prompt = "Repository name (or press Enter to finish): "
-        name = input(prompt).strip()
-        if not name:
+        line = input(prompt).strip()
+        if not line:
             break
-        if name not in repo_names:
-            repo_names.append(name)
-            print(f"   ✅ Added: {name}")
-        else:
-            print(f"   ⚠️  Already added: {name}")
+        for name in re.split(r"[\s,]+", line):
+            if not name:
+                continue
+            if any(char in name for char in "*?["):
+                matches = index.match(name)
+                if not matches:
+                    print(f"   ❌ No known repositories match: {name}")
+                for match in matches:
+                    add(match)
+                continue
+
+            if not index:
+                add(name)
+                continue
+
+            known_name = index.lookup(name)
+            if known_name:
+                add(known_name)
+                continue
+
+            print(f"   ❓ Unknown repository: {name}")
+            suggestions = index.suggest(name)
+            if suggestions:
+                print(f"      Did you mean: {', '.join(suggestions)}?")
+            if f"{org_name}/{name}" not in repo_names:
+                unknown_names.append(f"{org_name}/{name}")
+            add(name)
+
+    if unknown_names:
+        print(f"\n❓ {len(unknown_names)} repositories were not found among "
+              "the known names:")
+        for i, full_name in enumerate(unknown_names, 1):
+            print(f"   {i}. {full_name}")
+        print("They may still exist if the API view is limited.")
+        answer = input("Press Enter to keep them all, or enter the numbers "
+                       "to remove: ")
+        for number in re.split(r"[\s,]+", answer.strip()):
+            if number.isdigit() and 1 <= int(number) <= len(unknown_names):
+                full_name = unknown_names[int(number) - 1]
+                if full_name in repo_names:
+                    repo_names.remove(full_name)
+                    print(f"   🗑️  Removed: {full_name}")
 
     return repo_names
 
 
+def build_fork_parent_map(g: Github, destination: str = "personal",
+                          destination_name: str = None
+                          ) -> Optional[Dict[str, str]]:
+    """
+    List the destination's forks once and map parent full names to forks.
+    Keys are lowercased ``owner/name`` of the parent repository.
+    Returns None if the forks could not be listed.
+    """
+    if destination == "organization" and destination_name:
+        login = destination_name
+    else:
+        login = g.get_user().login
+
+    print(f"\n🔍 Checking existing forks in {login}...")
+
+    fork_parents = {}
+    try:
+        cursor = None
+        while True:
+            _, data = g.requester.graphql_query(
+                FORK_PARENTS_QUERY, {"login": login, "cursor": cursor})
+            owner = data["data"]["repositoryOwner"]
+            if owner is None:
+                break
+            repos = owner["repositories"]
+            for node in repos["nodes"]:
+                if node["parent"]:
+                    parent_name = node["parent"]["nameWithOwner"]
+                    fork_parents[parent_name.lower()] = node["nameWithOwner"]
+            if not repos["pageInfo"]["hasNextPage"]:
+                break
+            cursor = repos["pageInfo"]["endCursor"]
+    except Exception as e:
+        print(f"⚠️  GraphQL fork listing failed ({e}), using REST API")
+        try:
+            if destination == "organization" and destination_name:
+                forks = g.get_organization(destination_name).get_repos(
+                    type="forks")
+            else:
+                forks = (repo for repo in g.get_user().get_repos(type="owner")
+                         if repo.fork)
+            fork_parents = {}
+            for fork in forks:
+                if fork.parent:
+                    fork_parents[fork.parent.full_name.lower()] = \
+                        fork.full_name
+        except Exception as e:
+            print(f"❌ Could not list existing forks: {e}")
+            return None
+
+    print(f"✅ Found {len(fork_parents)} existing forks")
+    return fork_parents
+
+
 def filter_repositories_for_rescue(rescued_repos: List,
                                    manual_repos: List[str],
-                                   org_repos: List) -> List[str]:
+                                   fork_parents: Optional[Dict[str, str]]
+                                   ) -> List[str]:
     """
     Filter repositories to identify which ones need rescue.
-    Uses fork count from organization repos as the primary indicator.
+    Repositories are given and returned as full ``org/name`` names.
+    Uses the fork parent map from build_fork_parent_map as the primary
+    indicator, falling back to name matching if the map is unavailable.
     """
     repos_to_rescue = []
 
     print("🎯 Repository Filtering")
     print("=" * 30)
 
-    # Create a lookup for org repos by name
-    org_repo_lookup = {repo.name: repo for repo in org_repos}
-
     if manual_repos:
         print(f"🔍 Analyzing {len(manual_repos)} repositories:")
-        for repo_name in manual_repos:
-            # Check fork count in the organization repository
-            if repo_name in org_repo_lookup:
-                org_repo = org_repo_lookup[repo_name]
-                fork_count = org_repo.forks_count
-
-                if fork_count == 0:
-                    print(f"   ✅ {repo_name} - needs rescue (0 forks)")
-                    repos_to_rescue.append(repo_name)
+        for full_name in manual_repos:
+            repo_name = full_name.split("/", 1)[1]
+            if fork_parents is not None:
+                fork_name = fork_parents.get(full_name.lower())
+                if fork_name:
+                    print(f"   ⏭️  {full_name} - already forked as "
+                          f"{fork_name}")
                 else:
-                    print(f"   ⏭️  {repo_name} - already forked "
-                          f"({fork_count} fork"
-                          f"{'s' if fork_count != 1 else ''})")
-            else:
-                # Fallback: check personal repos for exact matches
-                already_rescued = False
-                for rescued in rescued_repos:
-                    # Exact match
-                    if repo_name.lower() == rescued.name.lower():
-                        already_rescued = True
-                        print(f"   ⏭️  {repo_name} - exact match with "
-                              f"{rescued.name}")
-                        print(f"        (created: {rescued.created_at}, "
-                              f"fork: {rescued.fork})")
-                        break
-                    # Rescued with prefix
-                    elif (rescued.name.lower() ==
-                          f"rescued-{repo_name.lower()}"):
-                        already_rescued = True
-                        print(f"   ⏭️  {repo_name} - found as {rescued.name}")
-                        print(f"        (created: {rescued.created_at}, "
-                              f"fork: {rescued.fork})")
-                        break
-
-                if not already_rescued:
-                    print(f"   ✅ {repo_name} - needs rescue "
-                          "(not found in org repos, checking personal)")
-                    repos_to_rescue.append(repo_name)
+                    print(f"   ✅ {full_name} - needs rescue (no fork found)")
+                    repos_to_rescue.append(full_name)
+                continue
+
+            # Fallback: check personal repos for exact matches
+            already_rescued = False
+            for rescued in rescued_repos:
+                # Exact match
+                if repo_name.lower() == rescued.name.lower():
+                    already_rescued = True
+                    print(f"   ⏭️  {full_name} - exact match with "
+                          f"{rescued.name}")
+                    print(f"        (created: {rescued.created_at}, "
+                          f"fork: {rescued.fork})")
+                    break
+                # Rescued with prefix
+                elif (rescued.name.lower() ==
+                      f"rescued-{repo_name.lower()}"):
+                    already_rescued = True
+                    print(f"   ⏭️  {full_name} - found as {rescued.name}")
+                    print(f"        (created: {rescued.created_at}, "
+                          f"fork: {rescued.fork})")
+                    break
+
+            if not already_rescued:
+                print(f"   ✅ {full_name} - needs rescue "
+                      "(no matching personal repo)")
+                repos_to_rescue.append(full_name)
 
     return repos_to_rescue
 
@@ -395,48 +868,168 @@ def get_fork_destination_options() -> tuple[str, str, str]:
     return destination, destination_name, name_prefix
 
 
+def classify_fork_error(e: Exception) -> str:
+    """
+    Classify a fork failure as 'not_found', 'abuse', 'retryable' or 'fatal'.
+    'abuse' covers secondary rate limits and exhausted primary limits.
+    """
+    if isinstance(e, (requests.exceptions.Timeout,
+                      requests.exceptions.ConnectionError,
+                      requests.exceptions.RetryError,
+                      urllib3.exceptions.MaxRetryError)):
+        return "retryable"
+    if not isinstance(e, GithubException):
+        return "fatal"
+    if isinstance(e, UnknownObjectException) or e.status == 404:
+        return "not_found"
+    if isinstance(e, RateLimitExceededException):
+        return "abuse"
+
+    headers = e.headers or {}
+    message = str(e).lower()
+    if e.status in (403, 429):
+        if ("retry-after" in headers
+                or headers.get("x-ratelimit-remaining") == "0"
+                or "rate limit" in message or "abuse" in message):
+            return "abuse"
+        return "fatal"
+    if e.status == 408 or e.status >= 500:
+        return "retryable"
+    return "fatal"
+
+
+def abuse_pause_seconds(e: Exception) -> float:
+    """Work out how long GitHub wants us to back off after an abuse error."""
+    headers = getattr(e, "headers", None) or {}
+    try:
+        if "retry-after" in headers:
+            return float(headers["retry-after"])
+        if headers.get("x-ratelimit-remaining") == "0":
+            reset = float(headers["x-ratelimit-reset"])
+            return max(reset - time.time(), 1.0)
+    except (KeyError, ValueError):
+        pass
+    return ABUSE_PAUSE_SECONDS
+
+
+class ForkCircuitBreaker:
+    """
+    Shared pause for all fork requests in a rescue run.
+    Opened when GitHub signals abuse detection; every fork waits until
+    the pause has elapsed before trying again.
+    """
+
+    def __init__(self):
+        self.open_until = 0.0
+
+    def trip(self, seconds: float) -> None:
+        """Open the breaker for at least the given number of seconds."""
+        self.open_until = max(self.open_until, time.time() + seconds)
+        print(f"   ⏸️  GitHub abuse detection triggered, pausing forks "
+              f"for {seconds:.0f}s")
+
+    def wait(self) -> None:
+        """Block until the breaker is closed."""
+        remaining = self.open_until - time.time()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
 def fork_repository(g: Github, org_name: str, repo_name: str,
                     destination: str = "personal",
                     destination_name: str = None,
-                    name_prefix: str = None) -> bool:
-    """Fork a repository with flexible destination and naming options."""
-    try:
-        # Get the repository to fork
-        repo = g.get_repo(f"{org_name}/{repo_name}")
+                    name_prefix: str = None,
+                    breaker: ForkCircuitBreaker = None) -> bool:
+    """
+    Fork a repository with flexible destination and naming options.
+    Transient errors are retried with jittered exponential backoff.
+    """
+    if breaker is None:
+        breaker = ForkCircuitBreaker()
 
-        # Determine the new name
-        if name_prefix:
-            new_name = f"{name_prefix}{repo_name}"
-        else:
-            new_name = repo_name
-
-        # Create fork
-        if destination == "organization" and destination_name:
-            # Fork to organization
-            fork = repo.create_fork(organization=destination_name,
-                                    name=new_name)
-            print(f"✅ Successfully forked to organization: {fork.full_name}")
-        else:
-            # Fork to personal account
-            fork = repo.create_fork(name=new_name)
-            print(f"✅ Successfully forked to personal: {fork.full_name}")
+    # Determine the new name
+    if name_prefix:
+        new_name = f"{name_prefix}{repo_name}"
+    else:
+        new_name = repo_name
 
-        return True
+    for attempt in range(1, FORK_MAX_ATTEMPTS + 1):
+        breaker.wait()
+        try:
+            # Get the repository to fork
+            repo = g.get_repo(f"{org_name}/{repo_name}")
 
-    except Exception as e:
-        if "404" in str(e) or "Not Found" in str(e):
-            print(f"❌ Cannot access {org_name}/{repo_name} via API")
-            print("   This is likely due to private repository restrictions.")
+            # Create fork
+            if destination == "organization" and destination_name:
+                # Fork to organization
+                fork = repo.create_fork(organization=destination_name,
+                                        name=new_name)
+                print("✅ Successfully forked to organization: "
+                      f"{fork.full_name}")
+            else:
+                # Fork to personal account
+                fork = repo.create_fork(name=new_name)
+                print(f"✅ Successfully forked to personal: {fork.full_name}")
+
+            return True
+
+        except Exception as e:
+            kind = classify_fork_error(e)
+            if kind == "not_found":
+                print(f"❌ Cannot access {org_name}/{repo_name} via API")
+                print("   This is likely due to private repository "
+                      "restrictions.")
+                return False
+            if kind == "fatal" or attempt == FORK_MAX_ATTEMPTS:
+                print(f"❌ Failed to fork {org_name}/{repo_name}: {e}")
+                return False
+
+            if kind == "abuse":
+                breaker.trip(abuse_pause_seconds(e))
+            else:
+                delay = min(FORK_BACKOFF_CAP,
+                            FORK_BACKOFF_BASE * 2 ** (attempt - 1))
+                delay = random.uniform(0, delay)
+                print(f"   ⚠️  Attempt {attempt} failed ({e}), retrying in "
+                      f"{delay:.1f}s")
+                time.sleep(delay)
+
+    return False
+
+
+def plan_fork_prefixes(repos_to_rescue: List[str],
+                       name_prefix: str = None) -> Dict[str, Optional[str]]:
+    """
+    Work out the name prefix to fork each ``org/name`` repository with.
+    Repositories sharing a name across organizations would collide in the
+    destination, so each of those also gets its organization as a prefix.
+    """
+    name_counts = {}
+    for full_name in repos_to_rescue:
+        repo_name = full_name.split("/", 1)[1].lower()
+        name_counts[repo_name] = name_counts.get(repo_name, 0) + 1
+
+    prefixes = {}
+    for full_name in repos_to_rescue:
+        org_name, repo_name = full_name.split("/", 1)
+        if name_counts[repo_name.lower()] > 1:
+            prefixes[full_name] = f"{name_prefix or ''}{org_name}-"
         else:
-            print(f"❌ Failed to fork {org_name}/{repo_name}: {e}")
-        return False
+            prefixes[full_name] = name_prefix
+    return prefixes
+
+
+def fork_display_name(full_name: str, prefix: Optional[str]) -> str:
+    """Name a repository will have once forked with the given prefix."""
+    repo_name = full_name.split("/", 1)[1]
+    return f"{prefix}{repo_name}" if prefix else repo_name
 
 
 def rescue_repositories(g: Github, repos_to_rescue: List[str],
                         destination: str = "personal",
                         destination_name: str = None,
                         name_prefix: str = None) -> None:
-    """Fork multiple repositories to rescue them."""
+    """Fork multiple repositories, given as ``org/name``, to rescue them."""
     print(f"\n🚀 Starting rescue operation for {len(repos_to_rescue)} "
           "repositories...")
 
@@ -455,17 +1048,21 @@ def rescue_repositories(g: Github, repos_to_rescue: List[str],
 
     successful_forks = []
     failed_forks = []
+    breaker = ForkCircuitBreaker()
+    prefixes = plan_fork_prefixes(repos_to_rescue, name_prefix)
 
-    for i, repo_name in enumerate(repos_to_rescue, 1):
-        print(f"\n[{i}/{len(repos_to_rescue)}] Forking: {repo_name}")
+    for i, full_name in enumerate(repos_to_rescue, 1):
+        print(f"\n[{i}/{len(repos_to_rescue)}] Forking: {full_name}")
 
-        success = fork_repository(g, "UWC2-PYTHON", repo_name,
-                                  destination, destination_name, name_prefix)
+        org_name, repo_name = full_name.split("/", 1)
+        success = fork_repository(g, org_name, repo_name,
+                                  destination, destination_name,
+                                  prefixes[full_name], breaker)
 
         if success:
-            successful_forks.append(repo_name)
+            successful_forks.append(full_name)
         else:
-            failed_forks.append(repo_name)
+            failed_forks.append(full_name)
 
     # Summary
     print("\n📊 Rescue Operation Complete!")
@@ -475,12 +1072,9 @@ def rescue_repositories(g: Github, repos_to_rescue: List[str],
 
     if successful_forks:
         print("\n🎉 Successfully rescued repositories:")
-        for repo in successful_forks:
-            if name_prefix:
-                display_name = f"{name_prefix}{repo}"
-            else:
-                display_name = repo
-            print(f"   - {display_name}")
+        for full_name in successful_forks:
+            display_name = fork_display_name(full_name, prefixes[full_name])
+            print(f"   - {display_name} (from {full_name})")
 
     if failed_forks:
         print("\n⚠️  Failed to rescue:")
@@ -492,13 +1086,14 @@ def rescue_repositories(g: Github, repos_to_rescue: List[str],
         print("For repositories that failed to fork via API, you can rescue")
         print("them manually:")
         print()
-        for repo in failed_forks:
-            print(f"🔗 {repo}:")
-            print(f"   1. Visit: https://github.com/UWC2-PYTHON/{repo}")
+        for full_name in failed_forks:
+            print(f"🔗 {full_name}:")
+            print(f"   1. Visit: https://github.com/{full_name}")
             print("   2. Click the 'Fork' button (top right)")
             print("   3. Choose your personal account as the destination")
-            if name_prefix:
-                suggested_name = f"{name_prefix}{repo}"
+            if prefixes[full_name]:
+                suggested_name = fork_display_name(full_name,
+                                                   prefixes[full_name])
                 print(f"   4. Optionally rename it to '{suggested_name}'")
             else:
                 print("   4. Keep the original name or rename as desired")
@@ -509,101 +1104,148 @@ def rescue_repositories(g: Github, repos_to_rescue: List[str],
         print("   interface.")
 
 
+def identify_student_repositories(repos: List, username: str) -> List[str]:
+    """Pick the student repositories out of an organization listing."""
+    student_repos = []
+    for repo in repos:
+        # Skip obvious template/resource repositories
+        skip_patterns = ['Resources', '.github', 'accessTestRepo',
+                         'README', 'template', 'base-', 'TEMPLATE']
+        should_skip = any(pattern.lower() in repo.name.lower()
+                          for pattern in skip_patterns)
+
+        if should_skip:
+            continue
+
+        # Include repositories with username or common patterns
+        has_username = username.lower() in repo.name.lower()
+        has_pattern = any(pattern in repo.name.lower()
+                          for pattern in ['lesson-', 'assignment-',
+                                          'exercise-', 'lab-', '310-',
+                                          '320-', '330-'])
+        if has_username or has_pattern:
+            student_repos.append(repo.full_name)
+
+    return student_repos
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Fork coursework out of GitHub Classroom organizations.")
+    parser.add_argument("orgs", nargs="*", default=DEFAULT_ORGS,
+                        help="source organizations to rescue from "
+                             f"(default: {' '.join(DEFAULT_ORGS)})")
+    parser.add_argument("--full-discovery", action="store_true",
+                        help="ignore discovery snapshots and list every "
+                             "organization repository")
+    return parser.parse_args()
+
+
 def main():
     """Main function."""
-    print("🎓 UWC2-PYTHON Code Rescue Tool")
+    args = parse_args()
+    # GitHub organization names are case-insensitive
+    orgs = list({org_name.lower(): org_name
+                 for org_name in args.orgs}.values())
+
+    print(f"🎓 {', '.join(orgs)} Code Rescue Tool")
     print("=" * 50)
     print("This tool helps you preserve your coursework by forking")
     print("repositories to your personal GitHub account.")
     print()
 
     # Get and verify token
-    token = get_github_token()
+    token = get_github_token(orgs)
     g = Github(auth=Auth.Token(token))
 
-    if not verify_token(g):
+    org_access = verify_token(g, orgs)
+    if not org_access:
         print("❌ Cannot proceed without valid token. Exiting.")
         return
 
     # Discover repositories
-    repos_result = discover_repositories(g)
-    personal_repos, api_accessible_repos, rescued_repos = repos_result
+    repos_result = discover_repositories(g, orgs, args.full_discovery)
+    personal_repos, org_repos, rescued_repos = repos_result
 
     print("\n📊 Summary:")
     print(f"   Personal repositories: {len(personal_repos)}")
-    print(f"   UWC2-PYTHON repositories (API accessible): "
-          f"{len(api_accessible_repos)}")
+    for org_name, repos in org_repos.items():
+        access = "" if org_access[org_name] else " (SSO needed)"
+        print(f"   {org_name} repositories (API accessible): "
+              f"{len(repos)}{access}")
     print(f"   Potentially already rescued: {len(rescued_repos)}")
 
-    if api_accessible_repos:
-        print("\n🎯 UWC2-PYTHON Repositories Available via API:")
-        for repo in api_accessible_repos:
-            visibility = "🔒" if repo.private else "🌍"
-            updated = repo.updated_at.strftime("%Y-%m-%d")
-            print(f"   {visibility} {repo.name} (updated: {updated})")
-            if repo.description:
-                print(f"      📝 {repo.description}")
-
-    # Get manual repository input or use API discoveries
-    if len(api_accessible_repos) >= 10:  # Good API access
-        print(f"\n🎉 Great news! We can see {len(api_accessible_repos)} "
-              "repositories via API.")
-        print("We can automatically identify your student repositories.")
-
-        # Filter for student repositories (containing username)
-        user = g.get_user()
-        username = user.login
-
-        student_repos = []
-        for repo in api_accessible_repos:
-            # Skip obvious template/resource repositories
-            skip_patterns = ['Resources', '.github', 'accessTestRepo',
-                             'README', 'template', 'base-', 'TEMPLATE']
-            should_skip = any(pattern.lower() in repo.name.lower()
-                              for pattern in skip_patterns)
-
-            if should_skip:
-                continue
-
-            # Include repositories with username or common patterns
-            has_username = username.lower() in repo.name.lower()
-            has_pattern = any(pattern in repo.name.lower()
-                              for pattern in ['lesson-', 'assignment-',
-                                              'exercise-', 'lab-', '310-',
-                                              '320-', '330-'])
-            if has_username or has_pattern:
-                student_repos.append(repo.name)
-
-        print(f"\n🎯 Found {len(student_repos)} student repositories:")
-        for repo_name in student_repos[:10]:  # Show first 10
-            print(f"   - {repo_name}")
-        if len(student_repos) > 10:
-            print(f"   ... and {len(student_repos) - 10} more")
-
-        manual_repos = student_repos
-    else:
-        print(f"\n⚠️  Note: Due to GitHub API limitations, we can only see "
-              f"{len(api_accessible_repos)} of your repositories.")
-        print("Let's manually identify the repositories you want to rescue.")
-        print("\n💡 If automatic forking fails, don't worry! The tool will")
-        print("   provide step-by-step instructions for manual rescue via")
-        print("   web interface.")
+    for org_name, repos in org_repos.items():
+        if repos:
+            print(f"\n🎯 {org_name} Repositories Available via API:")
+            for repo in repos:
+                visibility = "🔒" if repo.private else "🌍"
+                updated = repo.updated_at.strftime("%Y-%m-%d")
+                print(f"   {visibility} {repo.name} (updated: {updated})")
+                if repo.description:
+                    print(f"      📝 {repo.description}")
+
+    # Get manual repository input or use API discoveries, per organization
+    username = g.get_user().login
+    manual_repos = []
+    for org_name, repos in org_repos.items():
+        if len(repos) >= MIN_FULL_VIEW_REPOS:  # Good API access
+            print(f"\n🎉 Great news! We can see {len(repos)} {org_name} "
+                  "repositories via API.")
+            print("We can automatically identify your student repositories.")
+
+            student_repos = identify_student_repositories(repos, username)
+
+            print(f"\n🎯 Found {len(student_repos)} student repositories:")
+            for repo_name in student_repos[:10]:  # Show first 10
+                print(f"   - {repo_name}")
+            if len(student_repos) > 10:
+                print(f"   ... and {len(student_repos) - 10} more")
 
-        manual_repos = prompt_for_manual_repositories()
+            manual_repos.extend(student_repos)
+        else:
+            print(f"\n⚠️  Note: Due to GitHub API limitations, we can only "
+                  f"see {len(repos)} of your {org_name} repositories.")
+            print("Let's manually identify the repositories you want to "
+                  "rescue.")
+            print("\n💡 If automatic forking fails, don't worry! The tool "
+                  "will")
+            print("   provide step-by-step instructions for manual rescue "
+                  "via")
+            print("   web interface.")
+
+            index = RepoNameIndex(
+                known_repository_names(username, org_name, repos))
+            manual_repos.extend(prompt_for_manual_repositories(org_name,
+                                                               index))
+
+    # Merge into one rescue plan, dropping repositories entered twice;
+    # name clashes across organizations are handled by plan_fork_prefixes
+    manual_repos = list({name.lower(): name
+                         for name in manual_repos}.values())
 
     if manual_repos:
+        # Get destination and naming preferences
+        options = get_fork_destination_options()
+        destination, destination_name, name_prefix = options
+
+        fork_parents = build_fork_parent_map(g, destination, destination_name)
         repos_to_rescue = filter_repositories_for_rescue(rescued_repos,
                                                          manual_repos,
-                                                         api_accessible_repos)
+                                                         fork_parents)
 
         if repos_to_rescue:
             print(f"\n🚀 Ready to rescue {len(repos_to_rescue)} repositories:")
-            for repo_name in repos_to_rescue:
-                print(f"   - {repo_name}")
-
-            # Get destination and naming preferences
-            options = get_fork_destination_options()
-            destination, destination_name, name_prefix = options
+            prefixes = plan_fork_prefixes(repos_to_rescue, name_prefix)
+            for full_name in repos_to_rescue:
+                if prefixes[full_name] != name_prefix:
+                    display_name = fork_display_name(full_name,
+                                                     prefixes[full_name])
+                    print(f"   - {full_name} (as {display_name}, name is "
+                          "used in another organization)")
+                else:
+                    print(f"   - {full_name}")
 
             # Ask for confirmation
             if destination == "organization" and destination_name:
@@ -621,8 +1263,11 @@ def main():
             confirm = input("Do you want to proceed? (y/N): ").strip().lower()
 
             if confirm == 'y':
-                rescue_repositories(g, repos_to_rescue, destination,
-                                    destination_name, name_prefix)
+                # No PyGithub retries: fork_repository does its own
+                fork_client = Github(auth=Auth.Token(token), retry=None)
+                rescue_repositories(fork_client, repos_to_rescue,
+                                    destination, destination_name,
+                                    name_prefix)
             else:
                 print("❌ Rescue operation cancelled.")
         else: